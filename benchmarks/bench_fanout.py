@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark de fan-out en salas grandes: secuencial frente a shards en paralelo
+
+Para cada tamaño de sala publica mensajes por los dos caminos de
+SecureChatServer: deliver() en el hilo emisor (el de las salas pequeñas) y
+FanoutPool (el de las salas por encima de fanout_threshold). Mide cuánto
+queda bloqueado el emisor y cuánto tarda el mensaje en estar encolado en
+todos los miembros. Las conexiones son ClientConnection reales sin socket ni
+escritor: se mide solo el reparto.
+
+Uso: python benchmarks/bench_fanout.py [shards] [mensajes]
+"""
+
+import os
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'src' / 'core'))
+
+from server import SecureChatServer, ClientConnection, ChatRoom, SendBufferLimits  # noqa: E402
+from fanout import FanoutPool  # noqa: E402
+from protocol import MessageFactory  # noqa: E402
+
+ROOM_SIZES = (100, 1_000, 5_000, 20_000)
+
+
+class BenchConnection(ClientConnection):
+    """ClientConnection con su cola de salida pero sin socket, decoder ni escritor"""
+
+    def __init__(self, limits: SendBufferLimits):
+        self.connected = True
+        self.authenticated = True
+        self.codec = 'json'
+        self.compression = None
+        self.limits = limits
+        self._pending = []
+        self._pending_bytes = 0
+        self._skipped = 0
+        self._pending_lock = threading.Condition()
+
+    def reset(self):
+        self._pending = []
+        self._pending_bytes = 0
+
+
+def measure(server: SecureChatServer, pool: FanoutPool, size: int, messages: int) -> dict:
+    limits = SendBufferLimits(high_messages=messages * 2)
+    room = ChatRoom("all-hands", server)
+    members = [BenchConnection(limits) for _ in range(size)]
+    for member in members:
+        room.add(member)
+    room.shards(pool.size)  # Reparto cacheado, como tras las altas
+
+    sequential, sender, delivered = [], [], []
+    for _ in range(messages):
+        message = MessageFactory.create_chat_message("bench", "hola a todos")
+        start = time.perf_counter()
+        server.deliver(message, room.clients)
+        sequential.append(time.perf_counter() - start)
+
+    for member in members:
+        member.reset()
+
+    for _ in range(messages):
+        message = MessageFactory.create_chat_message("bench", "hola a todos")
+        start = time.perf_counter()
+        pool.fan_out(message, room.shards(pool.size))
+        sender.append(time.perf_counter() - start)
+        pool.join()
+        delivered.append(time.perf_counter() - start)
+
+    assert all(len(member._pending) == messages for member in members)
+    return {
+        "sequential_ms": statistics.median(sequential) * 1000,
+        "sender_ms": statistics.median(sender) * 1000,
+        "delivered_ms": statistics.median(delivered) * 1000
+    }
+
+
+if __name__ == "__main__":
+    shards = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    messages = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    os.chdir(ROOT)
+    Path("logs").mkdir(exist_ok=True)
+
+    server = SecureChatServer('127.0.0.1', 0)
+    server.logger.disabled = True
+    pool = FanoutPool(shards, server.deliver)
+    pool.start()
+
+    print(f"Mediana de {messages} mensajes por sala, {shards} shards, {os.cpu_count()} CPU\n")
+    print(f"{'miembros':>9}{'secuencial (ms)':>17}{'shards: emisor (ms)':>21}{'shards: entregado (ms)':>24}")
+    for size in ROOM_SIZES:
+        result = measure(server, pool, size, messages)
+        print(f"{size:>9}{result['sequential_ms']:>17.2f}{result['sender_ms']:>21.3f}"
+              f"{result['delivered_ms']:>24.2f}")
+    pool.shutdown()
\ No newline at end of file
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark de handshakes TLS por tipo de clave del certificado
+
+Genera un certificado auto-firmado de cada tipo (RSA-2048, EC P-256 y
+Ed25519), levanta un SecureChatServer con cada uno y lanza handshakes
+completos (sin reanudar sesión) desde varios hilos durante unos segundos.
+Mide handshakes por segundo y el tiempo medio de handshake que registra el
+servidor, para elegir el certificado más barato en producción.
+
+Uso: python benchmarks/bench_handshake.py [segundos] [hilos]
+"""
+
+import os
+import socket
+import ssl
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'src' / 'core'))
+sys.path.insert(0, str(ROOT / 'certificates'))
+
+from server import SecureChatServer  # noqa: E402
+from generate_certs import KEY_TYPES, generate_self_signed_cert  # noqa: E402
+
+HOST = '127.0.0.1'
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind((HOST, 0))
+        return sock.getsockname()[1]
+
+
+def client_context() -> ssl.SSLContext:
+    context = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    return context
+
+
+def measure(certfile: str, keyfile: str, seconds: float, threads: int) -> dict:
+    """Handshakes completos contra un servidor con el certificado dado"""
+    port = free_port()
+    server = SecureChatServer(HOST, port, certfile=certfile, keyfile=keyfile,
+                              max_clients=threads * 4, handshake_workers=threads)
+    server.logger.disabled = True
+    threading.Thread(target=server.start, daemon=True).start()
+    time.sleep(0.5)
+    
+    context = client_context()
+    deadline = time.monotonic() + seconds
+    counts = [0] * threads
+    errors = [0] * threads
+    
+    def worker(index: int):
+        while time.monotonic() < deadline:
+            try:
+                with socket.create_connection((HOST, port)) as raw:
+                    with context.wrap_socket(raw, server_hostname=HOST) as tls:
+                        tls.do_handshake()
+                counts[index] += 1
+            except (OSError, ssl.SSLError):
+                errors[index] += 1
+    
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    
+    # Dar tiempo al servidor a registrar los últimos handshakes
+    time.sleep(0.2)
+    stats = server.stats()
+    server.stop()
+    
+    return {
+        "per_second": sum(counts) / elapsed,
+        "errors": sum(errors),
+        "server_avg_ms": stats["handshake_avg_ms"]
+    }
+
+
+if __name__ == "__main__":
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 5.0
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    os.chdir(ROOT)
+    Path("logs").mkdir(exist_ok=True)
+    
+    results = {}
+    with tempfile.TemporaryDirectory() as cert_dir:
+        for key_type in KEY_TYPES:
+            if not generate_self_signed_cert(cert_dir, key_type=key_type, basename=key_type):
+                sys.exit(1)
+            results[key_type] = measure(f"{cert_dir}/{key_type}.crt", f"{cert_dir}/{key_type}.key",
+                                        seconds, threads)
+    
+    print(f"\nHandshakes TLS completos durante {seconds:.0f} s desde {threads} hilos\n")
+    print(f"{'clave':<10}{'handshakes/s':>14}{'servidor (ms)':>15}{'errores':>9}")
+    for key_type, result in results.items():
+        print(f"{key_type:<10}{result['per_second']:>14.1f}"
+              f"{result['server_avg_ms']:>15.3f}{result['errors']:>9}")
+    baseline = results["rsa"]["per_second"]
+    for key_type in KEY_TYPES[1:]:
+        print(f"{key_type} frente a rsa: x{results[key_type]['per_second'] / baseline:.2f}")
\ No newline at end of file
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark de throughput de broadcast: kTLS frente a TLS en espacio de usuario
+
+Levanta un SecureChatServer (engine threads) con y sin kTLS, conecta N
+clientes y hace broadcast de M mensajes de S bytes desde el propio servidor.
+Mide MB/s entregados al conjunto de clientes y CPU del proceso (cliente y
+servidor comparten proceso). Si el sistema no soporta kTLS el servidor cae
+a TLS en espacio de usuario y la tabla lo indica.
+
+Uso: python benchmarks/bench_ktls.py [clientes] [mensajes] [bytes]
+"""
+
+import contextlib
+import io
+import os
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'src' / 'core'))
+
+from server import SecureChatServer, create_server_ssl_context, probe_ktls  # noqa: E402
+from client_core import SecureChatClient  # noqa: E402
+from protocol import MessageFactory, MessageType  # noqa: E402
+
+HOST = '127.0.0.1'
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind((HOST, 0))
+        return sock.getsockname()[1]
+
+
+def run(ktls: bool, clients: int, messages: int, size: int) -> dict:
+    port = free_port()
+    server = SecureChatServer(HOST, port, ktls=ktls, max_clients=clients * 2,
+                              send_buffer={"high_messages": messages * 2,
+                                           "high_bytes": messages * size * 2})
+    server.logger.disabled = True
+    threading.Thread(target=server.start, daemon=True).start()
+    time.sleep(0.5)
+    
+    received = [0] * clients
+    everyone = threading.Event()
+    lock = threading.Lock()
+    pending = [clients]
+    
+    def on_message(index: int):
+        def callback(message):
+            if message.type != MessageType.CHAT:
+                return
+            received[index] += 1
+            if received[index] == messages:
+                with lock:
+                    pending[0] -= 1
+                    if not pending[0]:
+                        everyone.set()
+        return callback
+    
+    connected = []
+    for i in range(clients):
+        client = SecureChatClient(HOST, port, f"bench{i}")
+        client._handle_chat_message = lambda message: None
+        client.on_message_received = on_message(i)
+        client.connect()
+        connected.append(client)
+    
+    deadline = time.monotonic() + 10
+    while sum(1 for c in server.clients.snapshot() if c.authenticated) < clients:
+        if time.monotonic() > deadline:
+            raise RuntimeError("Los clientes no se autenticaron a tiempo")
+        time.sleep(0.01)
+    
+    stats = server.stats()
+    payload = "x" * size
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    for _ in range(messages):
+        server.broadcast_message(MessageFactory.create_chat_message("bench", payload))
+    everyone.wait(60)
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    
+    for client in connected:
+        client.disconnect()
+    server.stop()
+    
+    delivered = sum(received) * size
+    return {
+        "ktls": stats["ktls"],
+        "ktls_connections": stats["ktls_connections"],
+        "mb_per_s": delivered / wall / 1e6,
+        "cpu_ms": cpu * 1000,
+        "complete": all(count == messages for count in received)
+    }
+
+
+if __name__ == "__main__":
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    messages = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    size = int(sys.argv[3]) if len(sys.argv) > 3 else 4096
+    os.chdir(ROOT)
+    Path("logs").mkdir(exist_ok=True)
+    
+    results = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        for name, ktls in (("TLS usuario", False), ("kTLS pedido", True)):
+            results[name] = run(ktls, clients, messages, size)
+    
+    print(f"Broadcast de {messages} mensajes de {size} B a {clients} clientes\n")
+    print(f"{'modo':<14}{'kTLS':>6}{'conex. kTLS':>13}{'MB/s':>10}{'CPU (ms)':>10}{'completo':>10}")
+    for name, result in results.items():
+        print(f"{name:<14}{'sí' if result['ktls'] else 'no':>6}{result['ktls_connections']:>13}"
+              f"{result['mb_per_s']:>10.1f}{result['cpu_ms']:>10.1f}"
+              f"{'sí' if result['complete'] else 'no':>10}")
+    if not results["kTLS pedido"]["ktls"]:
+        context = create_server_ssl_context('certificates/server.crt', 'certificates/server.key', ktls=True)
+        print(f"\nkTLS no disponible aquí, el segundo modo usó TLS en espacio de usuario: "
+              f"{probe_ktls(context)}")
\ No newline at end of file
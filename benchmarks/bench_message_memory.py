@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark de memoria: bytes por mensaje encolado
+
+Compara la representación con __slots__ de ChatMessage contra la antigua
+basada en dataclass, con y sin la trama serializada en caché.
+"""
+
+import json
+import sys
+import time
+import tracemalloc
+from collections import deque
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src' / 'core'))
+
+from protocol import MessageType, MessageFactory  # noqa: E402
+
+
+@dataclass
+class LegacyChatMessage:
+    """Representación anterior (dataclass con __dict__)"""
+    type: MessageType
+    timestamp: float
+    sender: str
+    content: str
+    metadata: Optional[Dict[str, Any]] = None
+    
+    def to_json(self) -> str:
+        data = asdict(self)
+        data['type'] = self.type.value
+        return json.dumps(data)
+
+
+def measure(build, count: int) -> float:
+    """Devuelve los bytes asignados por mensaje al encolar count mensajes"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    queue = deque(build(i) for i in range(count))
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    del queue
+    return allocated / count
+
+
+def build_legacy(i: int) -> LegacyChatMessage:
+    return LegacyChatMessage(MessageType.CHAT, time.time(), "usuario", f"mensaje {i}", {"room": "general"})
+
+
+def build_slotted(i: int):
+    return MessageFactory.create_chat_message("usuario", f"mensaje {i}")
+
+
+def build_slotted_with_frame(i: int):
+    message = MessageFactory.create_chat_message("usuario", f"mensaje {i}")
+    message.to_frame()
+    return message
+
+
+def time_serialization(build, count: int) -> float:
+    """Microsegundos por to_json()"""
+    messages = [build(i) for i in range(count)]
+    start = time.perf_counter()
+    for message in messages:
+        message.to_json()
+    return (time.perf_counter() - start) / count * 1e6
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    
+    print(f"=== Memoria por mensaje encolado ({count} mensajes) ===")
+    print(f"dataclass (anterior):        {measure(build_legacy, count):8.1f} bytes")
+    print(f"__slots__:                   {measure(build_slotted, count):8.1f} bytes")
+    print(f"__slots__ + trama en caché:  {measure(build_slotted_with_frame, count):8.1f} bytes")
+    
+    print("\n=== Serialización to_json() ===")
+    print(f"dataclass + asdict:          {time_serialization(build_legacy, count):8.2f} us")
+    print(f"serializador directo:        {time_serialization(build_slotted, count):8.2f} us")
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Benchmark de una avalancha de reconexiones TLS
+
+Levanta el servidor en un proceso aparte, conecta N clientes una vez y
+después los reconecta todos a la vez, como tras un corte de red. Cada
+cliente tiene su propio SSLContext (y por tanto su propio ticket), creado
+antes de medir, como si fuera otra máquina; se compara:
+
+- handshake completo: los clientes nunca reutilizan la sesión
+- reanudación: reconectan al mismo proceso servidor con su ticket
+- tras reinicio: el servidor se reinicia entre la primera conexión y la
+  avalancha; las claves de los tickets eran del proceso anterior, así que
+  ninguna sesión se reanuda y todos vuelven al handshake completo
+- clúster: workers pre-fork que heredan el contexto del maestro; cada
+  cliente puede reconectar a un worker distinto del primero
+
+Mide tiempo, CPU del servidor (proceso y sus workers, leído de /proc) y
+sesiones reanudadas.
+
+Uso: python benchmarks/bench_reconnect.py [clientes] [workers]
+"""
+
+import contextlib
+import io
+import multiprocessing
+import os
+import socket
+import ssl
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'src' / 'core'))
+
+from server import SecureChatServer  # noqa: E402
+from client_core import SecureChatClient  # noqa: E402
+from cluster import ClusterSupervisor  # noqa: E402
+
+HOST = '127.0.0.1'
+CLOCK_TICKS = os.sysconf('SC_CLK_TCK')
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind((HOST, 0))
+        return sock.getsockname()[1]
+
+
+def run_server(port: int, clients: int, workers: int):
+    # Sin logs del servidor en la salida del benchmark
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.dup2(devnull, 2)
+    kwargs = dict(host=HOST, port=port, max_clients=clients * 2, handshake_workers=8)
+    if workers > 1:
+        ClusterSupervisor(workers, kwargs).run()
+    else:
+        SecureChatServer(**kwargs).start()
+
+
+def process_cpu(pid: int) -> float:
+    """Segundos de CPU (usuario + sistema) de pid y sus hijos directos vivos"""
+    total = 0.0
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as stat_file:
+                fields = stat_file.read().rsplit(')', 1)[1].split()
+        except OSError:
+            continue
+        if int(entry) == pid or int(fields[1]) == pid:
+            total += (int(fields[11]) + int(fields[12])) / CLOCK_TICKS
+    return total
+
+
+class ServerProcess:
+    """Servidor (o clúster) en un proceso hijo que se puede reiniciar"""
+    
+    def __init__(self, clients: int, workers: int = 1):
+        self.port = free_port()
+        self.clients = clients
+        self.workers = workers
+        self.process = None
+    
+    def start(self):
+        self.process = multiprocessing.get_context('fork').Process(
+            target=run_server, args=(self.port, self.clients, self.workers), daemon=True
+        )
+        self.process.start()
+        deadline = time.monotonic() + 10
+        while True:
+            try:
+                socket.create_connection((HOST, self.port), timeout=1).close()
+                break
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise RuntimeError("El servidor no arrancó")
+                time.sleep(0.05)
+        # Con clúster, dar tiempo a que arranquen todos los workers
+        time.sleep(0.5 if self.workers > 1 else 0.1)
+    
+    def stop(self):
+        self.process.terminate()
+        self.process.join(10)
+    
+    def restart(self):
+        self.stop()
+        self.start()
+    
+    def cpu(self) -> float:
+        return process_cpu(self.process.pid)
+
+
+def wait_for_session(client: SecureChatClient, timeout: float = 2.0):
+    """El ticket TLS 1.3 llega tras el handshake, con la primera lectura"""
+    deadline = time.monotonic() + timeout
+    while client._cached_session(client.ssl_context) is None and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+
+class FullHandshakeClient(SecureChatClient):
+    """Cliente que nunca reutiliza sesiones"""
+    
+    def _cached_session(self, context):
+        return None
+
+
+def client_context() -> ssl.SSLContext:
+    context = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    return context
+
+
+def storm(server: ServerProcess, clients: int, resume: bool, restart: bool = False) -> dict:
+    # Un contexto compartido guardaría una única sesión por servidor: tras un
+    # reinicio, el primer handshake completo daría un ticket válido al resto
+    contexts = [client_context() for _ in range(clients)]
+    client_class = SecureChatClient if resume else FullHandshakeClient
+    
+    def new_client(index: int) -> SecureChatClient:
+        return client_class(HOST, server.port, ssl_context=contexts[index])
+    
+    # Primera conexión de cada cliente (guarda su sesión en su contexto)
+    for index in range(clients):
+        client = new_client(index)
+        client.connect()
+        if resume:
+            wait_for_session(client)
+        client.disconnect()
+    
+    if restart:
+        server.restart()
+    
+    # Avalancha: todos reconectan a la vez con un cliente nuevo
+    barrier = threading.Barrier(clients + 1)
+    reconnected = [new_client(index) for index in range(clients)]
+    
+    def reconnect(client: SecureChatClient):
+        barrier.wait()
+        client.connect()
+    
+    threads = [threading.Thread(target=reconnect, args=(c,)) for c in reconnected]
+    for thread in threads:
+        thread.start()
+    
+    cpu_start = server.cpu()
+    wall_start = time.perf_counter()
+    barrier.wait()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - wall_start
+    # Los handshakes terminan en el servidor antes que en el cliente
+    cpu = server.cpu() - cpu_start
+    
+    resumed = sum(1 for c in reconnected if c.tls_resumed)
+    for client in reconnected:
+        client.disconnect()
+    
+    return {"wall_ms": wall * 1000, "cpu_ms": cpu * 1000, "resumed": resumed}
+
+
+if __name__ == "__main__":
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    os.chdir(ROOT)
+    Path("logs").mkdir(exist_ok=True)
+    
+    results = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        for name, cluster_workers, resume, restart in (
+                ("handshake completo", 1, False, False),
+                ("reanudación", 1, True, False),
+                ("tras reinicio", 1, True, True),
+                (f"clúster ({workers} workers)", workers, True, False)):
+            server = ServerProcess(clients, cluster_workers)
+            server.start()
+            try:
+                results[name] = storm(server, clients, resume, restart)
+            finally:
+                server.stop()
+    
+    print(f"Avalancha de {clients} reconexiones simultáneas\n")
+    print(f"{'escenario':<24}{'tiempo (ms)':>12}{'CPU servidor (ms)':>19}{'reanudadas':>12}")
+    for name, result in results.items():
+        print(f"{name:<24}{result['wall_ms']:>12.1f}{result['cpu_ms']:>19.1f}"
+              f"{result['resumed']:>8}/{clients}")
+    full, resumed = results["handshake completo"], results["reanudación"]
+    print(f"\nCPU del servidor ahorrada por la reanudación: "
+          f"{(1 - resumed['cpu_ms'] / full['cpu_ms']) * 100:.0f}%")
\ No newline at end of file
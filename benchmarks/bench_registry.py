@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark del registro de clientes bajo una avalancha de altas
+
+10k altas concurrentes (cada nombre lo piden dos hilos a la vez) mientras
+otro hilo hace broadcasts recorriendo el registro. Compara las estructuras
+anteriores (dict + set sin locks) con ClientRegistry (instantáneas inmutables):
+tiempo total, broadcasts completados y fallidos, y nombres concedidos dos
+veces.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src' / 'core'))
+
+from registry import ClientRegistry  # noqa: E402
+
+JOINS = 10_000
+THREADS = 32
+
+
+class FakeConnection:
+    """Lo mínimo de ClientConnection que usa el registro"""
+    
+    def __init__(self, key: int):
+        self.socket = key
+        self.username = ""
+
+
+class LegacyRegistry:
+    """Estructuras anteriores: dict por socket y set de nombres, sin locks"""
+    
+    def __init__(self):
+        self.clients = {}
+        self.usernames = set()
+    
+    def join(self, client_conn, username: str) -> bool:
+        self.clients[client_conn.socket] = client_conn
+        # Entre la comprobación y el alta puede colarse otro hilo
+        if username in self.usernames:
+            return False
+        self.usernames.add(username)
+        client_conn.username = username
+        return True
+    
+    def broadcast(self) -> int:
+        return sum(1 for _ in self.clients.values())
+
+
+class SnapshotRegistry:
+    def __init__(self):
+        self.clients = ClientRegistry()
+    
+    def join(self, client_conn, username: str) -> bool:
+        self.clients.add(client_conn)
+        return self.clients.reserve_username(username, client_conn)
+    
+    def broadcast(self) -> int:
+        return sum(1 for _ in self.clients.snapshot())
+
+
+def run(registry) -> dict:
+    granted = {}
+    granted_lock = threading.Lock()
+    done = threading.Event()
+    broadcasts = {"ok": 0, "failed": 0}
+    
+    def broadcaster():
+        while not done.is_set():
+            try:
+                registry.broadcast()
+                broadcasts["ok"] += 1
+            except RuntimeError:
+                broadcasts["failed"] += 1
+    
+    def joiner(worker: int):
+        # Los hilos i e i+1 piden los mismos nombres
+        names = range(worker // 2, JOINS // 2, THREADS // 2)
+        for i, n in enumerate(names):
+            client_conn = FakeConnection(worker * JOINS + i)
+            if registry.join(client_conn, f"user{n}"):
+                with granted_lock:
+                    granted[f"user{n}"] = granted.get(f"user{n}", 0) + 1
+    
+    broadcast_thread = threading.Thread(target=broadcaster)
+    broadcast_thread.start()
+    
+    start = time.perf_counter()
+    threads = [threading.Thread(target=joiner, args=(w,)) for w in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    
+    done.set()
+    broadcast_thread.join()
+    
+    return {
+        "ms": elapsed * 1000,
+        "broadcast_ok": broadcasts["ok"],
+        "broadcast_failed": broadcasts["failed"],
+        "duplicated_names": sum(1 for count in granted.values() if count > 1)
+    }
+
+
+if __name__ == "__main__":
+    sys.setswitchinterval(1e-5)  # Más cambios de hilo: más ocasiones de carrera
+    print(f"{JOINS} altas desde {THREADS} hilos, cada nombre pedido dos veces\n")
+    print(f"{'registro':<16}{'tiempo (ms)':>12}{'broadcasts':>12}{'fallidos':>10}{'nombres dup.':>14}")
+    for name, factory in (("dict + set", LegacyRegistry), ("ClientRegistry", SnapshotRegistry)):
+        result = run(factory())
+        print(f"{name:<16}{result['ms']:>12.1f}{result['broadcast_ok']:>12}"
+              f"{result['broadcast_failed']:>10}{result['duplicated_names']:>14}")
\ No newline at end of file
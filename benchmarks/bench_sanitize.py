@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark de ProtocolValidator.sanitize_content
+
+Compara la implementación actual (truncar + translate/regex) con la anterior
+(generador carácter a carácter) sobre texto ASCII, Unicode mixto y entradas
+hostiles de gran tamaño.
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src' / 'core'))
+
+from protocol import ProtocolValidator  # noqa: E402
+
+
+def legacy_sanitize(content: str) -> str:
+    """Implementación anterior: filtra todo y trunca al final"""
+    sanitized = ''.join(
+        char for char in content
+        if char.isprintable() or char in ['\n', '\t']
+    )
+    return sanitized[:516]
+
+
+CASES = {
+    "ascii corto": "Hola a todos, que tal? Nos vemos a las 5",
+    "ascii 516": "x" * 516,
+    "ascii con control": "linea\tcon\x1b[31mcolor\x07\n" * 20,
+    "unicode mixto": "Año nuevo 😀 — ¡salud! 你好 ​" * 15,
+    "hostil 1 MB ascii": "A" * (1024 * 1024),
+    "hostil 1 MB control": "\x00\x01\x1b" * (350 * 1024),
+    "hostil 1 MB unicode": "​😀̀" * (350 * 1024),
+}
+
+
+def bench(function, content: str, number: int) -> float:
+    """Microsegundos por llamada"""
+    return timeit.timeit(lambda: function(content), number=number) / number * 1e6
+
+
+if __name__ == "__main__":
+    print(f"{'caso':<22}{'anterior (us)':>16}{'actual (us)':>14}{'mejora':>10}")
+    for name, content in CASES.items():
+        number = 20 if len(content) > 100_000 else 20_000
+        legacy = bench(legacy_sanitize, content, number)
+        current = bench(ProtocolValidator.sanitize_content, content, number)
+        print(f"{name:<22}{legacy:>16.2f}{current:>14.2f}{legacy / current:>9.1f}x")
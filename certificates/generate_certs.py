@@ -1,54 +1,113 @@
 #!/usr/bin/env python3
+import argparse
+import datetime
+import ipaddress
 import sys
 from pathlib import Path
+from typing import Iterable
 
 try:
-    from OpenSSL import crypto
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+    from cryptography.x509.oid import NameOID
 except ImportError as e:
-    print(f"Error importando OpenSSL: {e}")
-    print("OpenSSL no está instalado. Ejecuta: pip3 install pyopenssl")
+    print(f"Error importando cryptography: {e}")
+    print("cryptography no está instalado. Ejecuta: pip3 install cryptography")
     sys.exit(1)
 
-def generate_self_signed_cert(cert_dir="certificates"):
-    """Genera certificado SSL auto-firmado para desarrollo"""
+# rsa: compatible con todo; ec (P-256) y ed25519: handshakes mucho más baratos
+# para el servidor. Ed25519 requiere TLS 1.3 y clientes con OpenSSL >= 1.1.1.
+KEY_TYPES = ("rsa", "ec", "ed25519")
+DEFAULT_SANS = ("localhost", "127.0.0.1", "::1")
+
+
+def generate_private_key(key_type: str = "rsa", rsa_bits: int = 2048):
+    """Clave privada del tipo pedido (rsa, ec P-256 o ed25519)"""
+    if key_type == "rsa":
+        return rsa.generate_private_key(public_exponent=65537, key_size=rsa_bits)
+    if key_type == "ec":
+        return ec.generate_private_key(ec.SECP256R1())
+    if key_type == "ed25519":
+        return ed25519.Ed25519PrivateKey.generate()
+    raise ValueError(f"Tipo de clave no soportado: {key_type} (opciones: {', '.join(KEY_TYPES)})")
+
+
+def build_san(names: Iterable[str]) -> x509.SubjectAlternativeName:
+    """SubjectAlternativeName con nombres DNS y direcciones IP"""
+    entries = []
+    for name in names:
+        try:
+            entries.append(x509.IPAddress(ipaddress.ip_address(name)))
+        except ValueError:
+            entries.append(x509.DNSName(name))
+    return x509.SubjectAlternativeName(entries)
+
+
+def generate_self_signed_cert(cert_dir="certificates", key_type="rsa", days=60,
+                              sans=DEFAULT_SANS, common_name="localhost",
+                              basename="server", overwrite=False):
+    """
+    Genera certificado SSL auto-firmado para desarrollo
+    
+    key_type: rsa (2048 bits), ec (P-256) o ed25519. days: validez en días.
+    sans: nombres DNS o IPs del SubjectAlternativeName. Escribe
+    <basename>.key y <basename>.crt en cert_dir; si ya existen no los toca
+    salvo con overwrite.
+    """
     
     print(f"Iniciando generación de certificados en: {cert_dir}")
     
     # Crear directorio si no existe (compatible con Windows)
     cert_path = Path(cert_dir)
     cert_path.mkdir(exist_ok=True)
-
-    key_file = cert_path / "server.key"
-    cert_file = cert_path / "server.crt"
     
-    if key_file.exists() and cert_file.exists():
+    key_file = cert_path / f"{basename}.key"
+    cert_file = cert_path / f"{basename}.crt"
+    
+    if key_file.exists() and cert_file.exists() and not overwrite:
         return True
     
     try:
-        key = crypto.PKey()
-        key.generate_key(crypto.TYPE_RSA, 2048)
-    
-        cert = crypto.X509()
-        cert.get_subject().C = "US"
-        cert.get_subject().ST = "State"
-        cert.get_subject().L = "City"
-        cert.get_subject().O = "Organization"
-        cert.get_subject().OU = "Organizational Unit"
-        cert.get_subject().CN = "localhost"  
-        cert.set_serial_number(1000)
-        cert.gmtime_adj_notBefore(0)
-        cert.gmtime_adj_notAfter(60*24*60*60)
-        cert.set_issuer(cert.get_subject())
-        cert.set_pubkey(key)
-        cert.sign(key, 'sha256')
+        key = generate_private_key(key_type)
+        
+        subject = x509.Name([
+            x509.NameAttribute(NameOID.COUNTRY_NAME, "US"),
+            x509.NameAttribute(NameOID.STATE_OR_PROVINCE_NAME, "State"),
+            x509.NameAttribute(NameOID.LOCALITY_NAME, "City"),
+            x509.NameAttribute(NameOID.ORGANIZATION_NAME, "Organization"),
+            x509.NameAttribute(NameOID.ORGANIZATIONAL_UNIT_NAME, "Organizational Unit"),
+            x509.NameAttribute(NameOID.COMMON_NAME, common_name),
+        ])
+        now = datetime.datetime.now(datetime.timezone.utc)
+        builder = (
+            x509.CertificateBuilder()
+            .subject_name(subject)
+            .issuer_name(subject)
+            .public_key(key.public_key())
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(now)
+            .not_valid_after(now + datetime.timedelta(days=days))
+            .add_extension(x509.BasicConstraints(ca=False, path_length=None), critical=True)
+        )
+        if sans:
+            builder = builder.add_extension(build_san(sans), critical=False)
+        
+        # Ed25519 firma sin digest aparte
+        algorithm = None if key_type == "ed25519" else hashes.SHA256()
+        cert = builder.sign(key, algorithm)
         
         with open(key_file, "wb") as f:
-            f.write(crypto.dump_privatekey(crypto.FILETYPE_PEM, key))
-
+            f.write(key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption()
+            ))
+        
         with open(cert_file, "wb") as f:
-            f.write(crypto.dump_certificate(crypto.FILETYPE_PEM, cert))
+            f.write(cert.public_bytes(serialization.Encoding.PEM))
         return True
-        
+    
     except Exception as e:
         print(f"Error generando certificados: {e}")
         import traceback
@@ -56,8 +115,21 @@ def generate_self_signed_cert(cert_dir="certificates"):
         return False
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Genera un certificado auto-firmado para el servidor")
+    parser.add_argument("--key-type", choices=KEY_TYPES, default="rsa",
+                        help="Tipo de clave (ec y ed25519 abaratan el handshake)")
+    parser.add_argument("--days", type=int, default=60, help="Validez en días")
+    parser.add_argument("--san", action="append", dest="sans",
+                        help="Nombre DNS o IP del certificado (repetible)")
+    parser.add_argument("--dir", default="certificates", help="Directorio de salida")
+    parser.add_argument("--force", action="store_true", help="Sobrescribir certificados existentes")
+    args = parser.parse_args()
+    
     print("Ejecutando generador de certificados...")
-    success = generate_self_signed_cert()
+    success = generate_self_signed_cert(
+        args.dir, key_type=args.key_type, days=args.days,
+        sans=args.sans or DEFAULT_SANS, overwrite=args.force
+    )
     if success:
         print("Generación de certificados COMPLETADA")
     else: